@@ -1,19 +1,23 @@
+from __future__ import annotations
+
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Callable
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Callable
 
 from cherry_core.ingest import ProviderConfig, Query
 from cherry_core.svm_decode import InstructionSignature, LogSignature
-from clickhouse_connect.driver.asyncclient import AsyncClient as ClickHouseClient
-from pyiceberg.catalog import Catalog as IcebergCatalog
-import deltalake
 import pyarrow as pa
-import pyarrow.dataset as pa_dataset
-import pyarrow.fs as pa_fs
-import duckdb
-import polars as pl
-import datafusion
+
+if TYPE_CHECKING:
+    from clickhouse_connect.driver.asyncclient import AsyncClient as ClickHouseClient
+    from pyiceberg.catalog import Catalog as IcebergCatalog
+    import deltalake
+    import pyarrow.dataset as pa_dataset
+    import pyarrow.fs as pa_fs
+    import duckdb
+    import polars as pl
+    import datafusion
 
 logger = logging.getLogger(__name__)
 
@@ -17,63 +17,56 @@ from .config import (
     SvmDecodeInstructionsConfig,
     SvmDecodeLogsConfig,
 )
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 from cherry_core.ingest import start_stream
 import pyarrow as pa
 from .writers.writer import create_writer
 from . import steps as step_def
-from copy import deepcopy
 
 logger = logging.getLogger(__name__)
 
 
+# step kind -> (config type, step implementation)
+_STEPS: Dict[
+    StepKind, Tuple[Type, Callable[[Dict[str, pa.Table], Any], Dict[str, pa.Table]]]
+] = {
+    StepKind.EVM_DECODE_EVENTS: (
+        EvmDecodeEventsConfig,
+        step_def.evm_decode_events.execute,
+    ),
+    StepKind.SVM_DECODE_INSTRUCTIONS: (
+        SvmDecodeInstructionsConfig,
+        step_def.svm_decode_instructions.execute,
+    ),
+    StepKind.SVM_DECODE_LOGS: (SvmDecodeLogsConfig, step_def.svm_decode_logs.execute),
+    StepKind.CAST: (CastConfig, step_def.cast.execute),
+    StepKind.HEX_ENCODE: (HexEncodeConfig, step_def.hex_encode.execute),
+    StepKind.U256_TO_BINARY: (U256ToBinaryConfig, step_def.u256_to_binary.execute),
+    StepKind.BASE58_ENCODE: (Base58EncodeConfig, step_def.base58_encode.execute),
+    StepKind.CAST_BY_TYPE: (CastByTypeConfig, step_def.cast_by_type.execute),
+    StepKind.DATAFUSION: (DataFusionStepConfig, step_def.datafusion_step.execute),
+    StepKind.POLARS: (PolarsStepConfig, step_def.polars_step.execute),
+    StepKind.SET_CHAIN_ID: (SetChainIdConfig, step_def.set_chain_id.execute),
+}
+
+
 def process_steps(
     data: Dict[str, pa.Table],
     steps: List[Step],
 ) -> Dict[str, pa.Table]:
     logger.debug("Processing pipeline steps")
 
-    data = deepcopy(data)
-
     for step in steps:
-        logger.debug(f"running step kind: {step.kind} name: {step.name}")
-
-        if step.kind == StepKind.EVM_DECODE_EVENTS:
-            assert isinstance(step.config, EvmDecodeEventsConfig)
-            data = step_def.evm_decode_events.execute(data, step.config)
-        elif step.kind == StepKind.SVM_DECODE_INSTRUCTIONS:
-            assert isinstance(step.config, SvmDecodeInstructionsConfig)
-            data = step_def.svm_decode_instructions.execute(data, step.config)
-        elif step.kind == StepKind.SVM_DECODE_LOGS:
-            assert isinstance(step.config, SvmDecodeLogsConfig)
-            data = step_def.svm_decode_logs.execute(data, step.config)
-        elif step.kind == StepKind.CAST:
-            assert isinstance(step.config, CastConfig)
-            data = step_def.cast.execute(data, step.config)
-        elif step.kind == StepKind.HEX_ENCODE:
-            assert isinstance(step.config, HexEncodeConfig)
-            data = step_def.hex_encode.execute(data, step.config)
-        elif step.kind == StepKind.U256_TO_BINARY:
-            assert isinstance(step.config, U256ToBinaryConfig)
-            data = step_def.u256_to_binary.execute(data, step.config)
-        elif step.kind == StepKind.BASE58_ENCODE:
-            assert isinstance(step.config, Base58EncodeConfig)
-            data = step_def.base58_encode.execute(data, step.config)
-        elif step.kind == StepKind.CAST_BY_TYPE:
-            assert isinstance(step.config, CastByTypeConfig)
-            data = step_def.cast_by_type.execute(data, step.config)
-        elif step.kind == StepKind.DATAFUSION:
-            assert isinstance(step.config, DataFusionStepConfig)
-            data = step_def.datafusion_step.execute(data, step.config)
-        elif step.kind == StepKind.POLARS:
-            assert isinstance(step.config, PolarsStepConfig)
-            data = step_def.polars_step.execute(data, step.config)
-        elif step.kind == StepKind.SET_CHAIN_ID:
-            assert isinstance(step.config, SetChainIdConfig)
-            data = step_def.set_chain_id.execute(data, step.config)
-        else:
+        logger.debug("running step kind: %s name: %s", step.kind, step.name)
+
+        entry = _STEPS.get(step.kind)
+        if entry is None:
             raise Exception(f"Unknown step kind: {step.kind}")
 
+        config_type, execute = entry
+        assert isinstance(step.config, config_type)
+        data = execute(data, step.config)
+
     return data
 
 
@@ -101,29 +94,81 @@ def merge_data(data: list[Dict[str, pa.Table]]) -> Dict[str, pa.Table]:
 
 async def run_pipeline(pipeline: Pipeline, pipeline_name: Optional[str] = None):
     logger.info(f"Running pipeline: {pipeline_name}")
-    logger.debug(f"Pipeline config: {pipeline}")
+    logger.debug("Pipeline config: %s", pipeline)
 
     stream = start_stream(pipeline.provider, pipeline.query)
 
     writer = create_writer(pipeline.writer)
 
-    while True:
-        data = await stream.next()
-        if data is None:
-            break
+    # the previous batch is written while the next one is fetched and processed,
+    # only one write is in flight at a time so batches are written in order.
+    # a started write is always let finish, even if the pipeline fails or is
+    # cancelled, so it is only awaited through shield/wait and never directly
+    pending_write: Optional[asyncio.Task] = None
+
+    try:
+        while True:
+            data = await _next_batch(stream, pending_write)
+            if data is None:
+                break
+
+            logger.debug("Received data from ingest")
+
+            tables = {}
+
+            for table_name, table_batch in data.items():
+                tables[table_name] = pa.Table.from_batches([table_batch])
+
+            processed = await asyncio.to_thread(process_steps, tables, pipeline.steps)
+
+            if pending_write is not None:
+                await asyncio.shield(pending_write)
+
+            logger.debug("Pushing data to writer")
+
+            pending_write = asyncio.create_task(
+                writer.push_data(processed), name="push data to writer"
+            )
+
+        if pending_write is not None:
+            await asyncio.shield(pending_write)
+    except BaseException as e:
+        if pending_write is not None:
+            await asyncio.wait([pending_write])
+
+            # a failure of the write is only logged so the original error is what
+            # gets raised, unless the write failure is the original error
+            if not pending_write.cancelled():
+                write_error = pending_write.exception()
+                if write_error is not None and write_error is not e:
+                    logger.error(
+                        "Writing the previous batch failed", exc_info=write_error
+                    )
+        raise
 
-        logger.debug("Received data from ingest")
 
-        tables = {}
+async def _next_batch(
+    stream: Any, pending_write: Optional[asyncio.Task]
+) -> Optional[Dict[str, pa.RecordBatch]]:
+    if pending_write is None:
+        return await stream.next()
 
-        for table_name, table_batch in data.items():
-            tables[table_name] = pa.Table.from_batches([table_batch])
+    # wait on the write too so a failed write is raised right away instead of
+    # after the stream returns, which can take long at the chain head
+    fetch = asyncio.ensure_future(stream.next())
 
-        processed = await asyncio.to_thread(process_steps, tables, pipeline.steps)
+    try:
+        done, _ = await asyncio.wait(
+            [fetch, pending_write], return_when=asyncio.FIRST_COMPLETED
+        )
 
-        logger.debug("Pushing data to writer")
+        if pending_write in done:
+            pending_write.result()
 
-        await writer.push_data(processed)
+        return await fetch
+    except BaseException:
+        fetch.cancel()
+        raise
 
 
 __all__ = ["run_pipeline"]
@@ -1,5 +1,4 @@
 from typing import Dict
-from copy import deepcopy
 
 from ..config import Base58EncodeConfig
 from cherry_core import base58_encode
@@ -10,7 +9,7 @@ from .util import arrow_schema_binary_to_string
 def execute(
     data: Dict[str, pa.Table], config: Base58EncodeConfig
 ) -> Dict[str, pa.Table]:
-    data = deepcopy(data)
+    data = dict(data)
 
     table_names = data.keys() if config.tables is None else config.tables
 
@@ -1,5 +1,4 @@
 from typing import Dict
-from copy import deepcopy
 
 import pyarrow as pa
 from cherry_core import cast_by_type, cast_schema_by_type
@@ -7,7 +6,7 @@ from ..config import CastByTypeConfig
 
 
 def execute(data: Dict[str, pa.Table], config: CastByTypeConfig) -> Dict[str, pa.Table]:
-    data = deepcopy(data)
+    data = dict(data)
 
     for table_name, table_data in data.items():
         batches = table_data.to_batches()
@@ -2,12 +2,13 @@ from typing import Dict
 
 from ..config import DataFusionStepConfig
 import pyarrow as pa
-import datafusion
 
 
 def execute(
     data: Dict[str, pa.Table], config: DataFusionStepConfig
 ) -> Dict[str, pa.Table]:
+    import datafusion
+
     df_data = {}
 
     ctx = datafusion.SessionContext()
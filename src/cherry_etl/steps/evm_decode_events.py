@@ -1,15 +1,15 @@
 from typing import Dict
-from copy import deepcopy
 
 from cherry_core import evm_decode_events, evm_event_signature_to_arrow_schema
 from ..config import EvmDecodeEventsConfig
 import pyarrow as pa
+from .util import arrow_table_hstack
 
 
 def execute(
     data: Dict[str, pa.Table], config: EvmDecodeEventsConfig
 ) -> Dict[str, pa.Table]:
-    data = deepcopy(data)
+    data = dict(data)
 
     input_table = data[config.input_table]
     input_batches = input_table.to_batches()
@@ -27,8 +27,7 @@ def execute(
     )
 
     if config.hstack:
-        for i, col in enumerate(input_table.columns):
-            output_table = output_table.append_column(input_table.field(i), col)
+        output_table = arrow_table_hstack(output_table, input_table)
 
     data[config.output_table] = output_table
 
@@ -1,5 +1,4 @@
 from typing import Dict
-from copy import deepcopy
 
 from ..config import HexEncodeConfig
 from cherry_core import hex_encode, prefix_hex_encode
@@ -8,7 +7,7 @@ from .util import arrow_schema_binary_to_string
 
 
 def execute(data: Dict[str, pa.Table], config: HexEncodeConfig) -> Dict[str, pa.Table]:
-    data = deepcopy(data)
+    data = dict(data)
 
     decode_fn = prefix_hex_encode if config.prefixed else hex_encode
 
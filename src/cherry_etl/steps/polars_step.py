@@ -2,14 +2,16 @@ from typing import Dict
 
 from ..config import PolarsStepConfig
 import pyarrow as pa
-import polars as pl
 
 
 def execute(data: Dict[str, pa.Table], config: PolarsStepConfig) -> Dict[str, pa.Table]:
+    import polars as pl
+
     pl_data = {}
 
     for name, table in data.items():
-        pl_data[name] = pl.from_arrow(table)
+        # keep arrow's chunking, rechunking would copy every column
+        pl_data[name] = pl.from_arrow(table, rechunk=False)
 
     out = config.runner(pl_data, config.context)
 
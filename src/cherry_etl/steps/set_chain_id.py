@@ -9,10 +9,8 @@ def execute(data: Dict[str, pa.Table], config: SetChainIdConfig) -> Dict[str, pa
 
     for table_name, table in data.items():
         o = table
-        for name in table.schema.names:
-            if name == "chain_id":
-                o = table.drop_columns("chain_id")
-                break
+        if table.schema.get_all_field_indices("chain_id"):
+            o = table.drop_columns("chain_id")
         out[table_name] = o.append_column(
             "chain_id",
             pa.repeat(
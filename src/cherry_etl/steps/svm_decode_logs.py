@@ -1,16 +1,16 @@
 from typing import Dict
-from copy import deepcopy
 
 from cherry_core import svm_decode_logs, instruction_signature_to_arrow_schema
 from cherry_core.svm_decode import InstructionSignature
 from ..config import SvmDecodeLogsConfig
 import pyarrow as pa
+from .util import arrow_table_hstack
 
 
 def execute(
     data: Dict[str, pa.Table], config: SvmDecodeLogsConfig
 ) -> Dict[str, pa.Table]:
-    data = deepcopy(data)
+    data = dict(data)
 
     input_table = data[config.input_table]
     input_batches = input_table.to_batches()
@@ -35,8 +35,7 @@ def execute(
     )
 
     if config.hstack:
-        for i, col in enumerate(input_table.columns):
-            output_table = output_table.append_column(input_table.field(i), col)
+        output_table = arrow_table_hstack(output_table, input_table)
 
     data[config.output_table] = output_table
 
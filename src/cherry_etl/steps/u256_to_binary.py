@@ -1,5 +1,4 @@
 from typing import Dict
-from copy import deepcopy
 
 from cherry_core import u256_to_binary
 import pyarrow as pa
@@ -11,7 +10,7 @@ from .util import arrow_schema_cast_by_type
 def execute(
     data: Dict[str, pa.Table], config: U256ToBinaryConfig
 ) -> Dict[str, pa.Table]:
-    data = deepcopy(data)
+    data = dict(data)
 
     table_names = data.keys() if config.tables is None else config.tables
 
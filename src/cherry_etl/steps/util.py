@@ -1,19 +1,18 @@
 import pyarrow as pa
-from copy import deepcopy
 
 
 def arrow_schema_cast_by_type(
     schema: pa.Schema, from_type: pa.DataType, to_type: pa.DataType
 ) -> pa.Schema:
-    schema = deepcopy(schema)
+    fields = []
 
-    for i, name in enumerate(schema.names):
-        dt = schema.field(i).type
+    for field in schema:
+        dt = field.type
         if dt == from_type:
             dt = to_type
-        schema = schema.set(i, pa.field(name, dt))
+        fields.append(pa.field(field.name, dt))
 
-    return schema
+    return pa.schema(fields, metadata=schema.metadata)
 
 
 def arrow_schema_binary_to_string(schema: pa.Schema):
@@ -30,3 +29,12 @@ def arrow_table_to_batch(table: pa.Table) -> pa.RecordBatch:
         arrays.append(col.combine_chunks())
 
     return pa.RecordBatch.from_arrays(arrays, names=table.column_names)
+
+
+def arrow_table_hstack(left: pa.Table, right: pa.Table) -> pa.Table:
+    fields = list(left.schema) + list(right.schema)
+
+    return pa.Table.from_arrays(
+        left.columns + right.columns,
+        schema=pa.schema(fields, metadata=left.schema.metadata),
+    )
@@ -1,4 +1,13 @@
-# from . import iceberg, clickhouse
-from . import clickhouse, delta_lake, iceberg
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import clickhouse, delta_lake, iceberg
 
 __all__ = ["iceberg", "clickhouse", "delta_lake"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
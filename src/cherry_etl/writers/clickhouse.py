@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, cast as type_cast
+from typing import Dict, List, Set, cast as type_cast
 import pyarrow as pa
 from ..writers.base import DataWriter
 from ..config import ClickHouseWriterConfig
@@ -8,44 +8,36 @@ import asyncio
 logger = logging.getLogger(__name__)
 
 
+# Arrow types that map to a fixed ClickHouse type, parameterized and nested
+# types are handled in pyarrow_type_to_clickhouse
+_PRIMITIVE_TYPES: Dict[pa.DataType, str] = {
+    pa.bool_(): "Bool",
+    pa.int8(): "Int8",
+    pa.int16(): "Int16",
+    pa.int32(): "Int32",
+    pa.int64(): "Int64",
+    pa.uint8(): "UInt8",
+    pa.uint16(): "UInt16",
+    pa.uint32(): "UInt32",
+    pa.uint64(): "UInt64",
+    pa.float16(): "Float32",  # ClickHouse doesn't support Float16
+    pa.float32(): "Float32",
+    pa.float64(): "Float64",
+    pa.string(): "String",
+    pa.large_string(): "String",
+    pa.binary(): "String",  # ClickHouse uses String for binary data too
+    pa.large_binary(): "String",  # ClickHouse uses String for binary data too
+    pa.date32(): "Date",  # Date32 in Arrow is the same as Date in ClickHouse
+    pa.date64(): "DateTime",  # Date64 maps to DateTime
+}
+
+
 def pyarrow_type_to_clickhouse(dt: pa.DataType) -> str:
-    if pa.types.is_boolean(dt):
-        return "Bool"
-    elif pa.types.is_int8(dt):
-        return "Int8"
-    elif pa.types.is_int16(dt):
-        return "Int16"
-    elif pa.types.is_int32(dt):
-        return "Int32"
-    elif pa.types.is_int64(dt):
-        return "Int64"
-    elif pa.types.is_uint8(dt):
-        return "UInt8"
-    elif pa.types.is_uint16(dt):
-        return "UInt16"
-    elif pa.types.is_uint32(dt):
-        return "UInt32"
-    elif pa.types.is_uint64(dt):
-        return "UInt64"
-    elif pa.types.is_float16(dt):
-        return "Float32"  # ClickHouse doesn't support Float16
-    elif pa.types.is_float32(dt):
-        return "Float32"
-    elif pa.types.is_float64(dt):
-        return "Float64"
-    elif pa.types.is_string(dt):
-        return "String"
-    elif pa.types.is_large_string(dt):
-        return "String"
-    elif pa.types.is_binary(dt):
-        return "String"  # ClickHouse uses String for binary data too
-    elif pa.types.is_large_binary(dt):
-        return "String"  # ClickHouse uses String for binary data too
-    elif pa.types.is_date32(dt):
-        return "Date"  # Date32 in Arrow is the same as Date in ClickHouse
-    elif pa.types.is_date64(dt):
-        return "DateTime"  # Date64 maps to DateTime
-    elif pa.types.is_timestamp(dt):
+    ch_type = _PRIMITIVE_TYPES.get(dt)
+    if ch_type is not None:
+        return ch_type
+
+    if pa.types.is_timestamp(dt):
         return "DateTime"  # Timestamp maps to DateTime
     elif pa.types.is_time32(dt):
         return "Int32"  # Time32 in Arrow maps to Int32 in ClickHouse
@@ -96,31 +88,28 @@ class Writer(DataWriter):
         self.engine = config.engine
         self.create_tables = config.create_tables
 
-    async def _create_table_if_not_exists(self, table_name: str, schema: pa.Schema):
-        if not await self._check_table_exists(table_name):
-            await self._create_table(table_name, schema)
-        else:
-            logger.debug(f"table {table_name} already exists so skipping creation")
+    async def _get_existing_tables(self, table_names: List[str]) -> Set[str]:
+        if len(table_names) == 0:
+            return set()
 
-    async def _check_table_exists(self, table_name: str) -> bool:
+        names = ", ".join(f"'{table_name}'" for table_name in table_names)
         res = await self.client.query(
-            f"SELECT count() > 0 as table_exists FROM system.tables WHERE database = '{self.client.client.database}' AND name = '{table_name}'"
+            f"SELECT name FROM system.tables WHERE database = '{self.client.client.database}' AND name IN ({names})"
         )
 
-        return bool(res.result_rows[0][0])
+        return {row[0] for row in res.result_rows}
 
     async def _create_table(self, table_name: str, schema: pa.Schema) -> None:
         columns = []
 
+        table_codec = self.codec.get(table_name, {})
+
         for field in schema:
             ch_type = pyarrow_type_to_clickhouse(field.type)
             col_def = f"`{field.name}` {ch_type}"
 
-            if table_name in self.codec:
-                table_codec = self.codec[table_name]
-
-                if field.name in table_codec:
-                    col_def += f" CODEC({table_codec[field.name]})"
+            if field.name in table_codec:
+                col_def += f" CODEC({table_codec[field.name]})"
 
             columns.append(col_def)
 
@@ -147,14 +136,29 @@ class Writer(DataWriter):
                 logger.debug(f"creating index with {skip_index}")
                 await self.client.command(skip_index)
 
+    async def _insert_table(self, table_name: str, table_data: pa.Table) -> None:
+        # skip the round trip to the server if there is nothing to insert
+        if table_data.num_rows == 0:
+            return
+
+        await self.client.insert_arrow(table_name, table_data)
+
     async def push_data(self, data: Dict[str, pa.Table]) -> None:
         # create tables if this is the first insert
         if self.create_tables and self.first_insert:
+            existing_tables = await self._get_existing_tables(list(data.keys()))
+
             tasks = []
 
             for table_name, table_data in data.items():
+                if table_name in existing_tables:
+                    logger.debug(
+                        f"table {table_name} already exists so skipping creation"
+                    )
+                    continue
+
                 task = asyncio.create_task(
-                    self._create_table_if_not_exists(table_name, table_data.schema),
+                    self._create_table(table_name, table_data.schema),
                     name=f"create table {table_name}",
                 )
                 tasks.append(task)
@@ -171,7 +175,7 @@ class Writer(DataWriter):
                 continue
 
             task = asyncio.create_task(
-                self.client.insert_arrow(table_name, table_data),
+                self._insert_table(table_name, table_data),
                 name=f"write to {table_name}",
             )
 
@@ -183,4 +187,4 @@ class Writer(DataWriter):
         # insert into anchor table after all other inserts are done
         if self.anchor_table is not None:
             table_data = data[self.anchor_table]
-            await self.client.insert_arrow(self.anchor_table, table_data)
+            await self._insert_table(self.anchor_table, table_data)
@@ -29,6 +29,8 @@ class Writer(DataWriter):
             mode="append",
             schema_mode="merge",
             storage_options=self.config.storage_options,
+            # the overloads of write_deltalake don't accept None but the implementation does
+            writer_properties=self.config.writer_properties,  # pyright: ignore[reportArgumentType]
         )
 
     async def push_data(self, data: Dict[str, pa.Table]) -> None:
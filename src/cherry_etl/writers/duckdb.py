@@ -4,7 +4,6 @@ import pyarrow as pa
 from .base import DataWriter
 from ..config import DuckdbWriterConfig
 import asyncio
-import duckdb
 
 logger = logging.getLogger(__name__)
 
@@ -17,34 +16,22 @@ class Writer(DataWriter):
     def push_data_impl(self, data: Dict[str, pa.Table]) -> None:
         self.connection.begin()
 
-        if self.first_push:
-            for table_name, table_data in data.items():
-                try:
-                    self.connection.table(table_name)
-                    self.connection.sql(
-                        f"INSERT INTO {table_name} SELECT * FROM table_data"
-                    )
-                except duckdb.CatalogException:
-                    logger.debug(
-                        f"creating table {table_name} as it doesn't exist in the database yet"
-                    )
-                    self.connection.sql(
-                        f"CREATE TABLE {table_name} AS SELECT * FROM table_data"
-                    )
-
-                # ignore lint warning relating to unused variable
-                # this variable is used in the sql query string
-                _ = table_data
-
-            self.first_push = False
-        else:
-            for table_name, table_data in data.items():
+        for table_name, table_data in data.items():
+            if self.first_push:
+                # create missing tables from the arrow schema
                 self.connection.sql(
-                    f"INSERT INTO {table_name} SELECT * FROM table_data"
+                    f"CREATE TABLE IF NOT EXISTS {table_name} AS SELECT * FROM table_data LIMIT 0"
                 )
-                # ignore lint warning relating to unused variable
-                # this variable is used in the sql query string
-                _ = table_data
+
+            if table_data.num_rows == 0:
+                continue
+
+            self.connection.sql(f"INSERT INTO {table_name} SELECT * FROM table_data")
+            # ignore lint warning relating to unused variable
+            # this variable is used in the sql query string
+            _ = table_data
+
+        self.first_push = False
 
         self.connection.commit()
 
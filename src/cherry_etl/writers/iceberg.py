@@ -2,6 +2,8 @@ import logging
 from typing import Dict
 from ..writers.base import DataWriter
 from ..config import IcebergWriterConfig
+from pyiceberg.exceptions import CommitFailedException
+from pyiceberg.table import Table as IcebergTable
 import pyarrow as pa
 
 logger = logging.getLogger(__name__)
@@ -24,20 +26,38 @@ class Writer(DataWriter):
         self.first_write = True
         self.write_location = config.write_location
         self.catalog = config.catalog
+        # table handles are kept across pushes so the catalog isn't hit on every write
+        self.tables: Dict[str, IcebergTable] = {}
 
     async def write_table(self, table_name: str, arrow_table: pa.Table) -> None:
-        logger.debug(f"Writing table: {table_name}")
+        logger.debug("Writing table: %s", table_name)
 
-        table_identifier = f"{self.namespace}.{table_name}"
+        # appending an empty table would still commit a new snapshot
+        if arrow_table.num_rows == 0:
+            return
 
-        iceberg_table = self.catalog.load_table(table_identifier)
-        iceberg_table.append(arrow_table)
+        iceberg_table = self.tables.get(table_name)
+        if iceberg_table is None:
+            table_identifier = f"{self.namespace}.{table_name}"
+            iceberg_table = self.catalog.load_table(table_identifier)
+            self.tables[table_name] = iceberg_table
+
+        try:
+            iceberg_table.append(arrow_table)
+        except CommitFailedException:
+            # the cached handle is stale if something else committed to the table,
+            # reload its metadata and retry once
+            logger.debug("Commit to %s failed, refreshing table", table_name)
+            iceberg_table.refresh()
+            iceberg_table.append(arrow_table)
 
     async def push_data(self, data: Dict[str, pa.Table]) -> None:
         if self.first_write:
+            # catalog calls stay on the caller's thread, the catalog the user passes
+            # in isn't necessarily usable from other threads (e.g. in-memory sqlite)
             for table_name, table_data in data.items():
                 table_identifier = f"{self.namespace}.{table_name}"
-                self.catalog.create_table_if_not_exists(
+                self.tables[table_name] = self.catalog.create_table_if_not_exists(
                     identifier=table_identifier,
                     schema=table_data.schema,
                     location=self.write_location,
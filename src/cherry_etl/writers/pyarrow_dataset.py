@@ -16,6 +16,9 @@ class Writer(DataWriter):
         self.config.base_dir = self.config.base_dir.rstrip("/")
 
     async def _write_table(self, table_name: str, table_data: pa.Table) -> None:
+        if table_data.num_rows == 0:
+            return
+
         await asyncio.to_thread(
             pa_dataset.write_dataset,
             data=table_data,
@@ -1,4 +1,3 @@
-from . import pyarrow_dataset
 from ..writers.base import DataWriter
 from ..config import (
     Writer,
@@ -9,28 +8,30 @@ from ..config import (
     PyArrowDatasetWriterConfig,
     DuckdbWriterConfig,
 )
-from ..writers import iceberg, clickhouse, delta_lake, duckdb
+from typing import Dict, Tuple, Type
+import importlib
 import logging
 
 logger = logging.getLogger(__name__)
 
+_WRITERS: Dict[WriterKind, Tuple[str, Type]] = {
+    WriterKind.ICEBERG: ("iceberg", IcebergWriterConfig),
+    WriterKind.CLICKHOUSE: ("clickhouse", ClickHouseWriterConfig),
+    WriterKind.DELTA_LAKE: ("delta_lake", DeltaLakeWriterConfig),
+    WriterKind.PYARROW_DATASET: ("pyarrow_dataset", PyArrowDatasetWriterConfig),
+    WriterKind.DUCKDB: ("duckdb", DuckdbWriterConfig),
+}
+
 
 def create_writer(writer: Writer) -> DataWriter:
-    match writer.kind:
-        case WriterKind.ICEBERG:
-            assert isinstance(writer.config, IcebergWriterConfig)
-            return iceberg.Writer(writer.config)
-        case WriterKind.CLICKHOUSE:
-            assert isinstance(writer.config, ClickHouseWriterConfig)
-            return clickhouse.Writer(writer.config)
-        case WriterKind.DELTA_LAKE:
-            assert isinstance(writer.config, DeltaLakeWriterConfig)
-            return delta_lake.Writer(writer.config)
-        case WriterKind.PYARROW_DATASET:
-            assert isinstance(writer.config, PyArrowDatasetWriterConfig)
-            return pyarrow_dataset.Writer(writer.config)
-        case WriterKind.DUCKDB:
-            assert isinstance(writer.config, DuckdbWriterConfig)
-            return duckdb.Writer(writer.config)
-        case _:
-            raise ValueError(f"Invalid writer kind: {writer.kind}")
+    entry = _WRITERS.get(writer.kind)
+    if entry is None:
+        raise ValueError(f"Invalid writer kind: {writer.kind}")
+
+    module_name, config_type = entry
+    assert isinstance(writer.config, config_type)
+
+    # imported here so only the configured backend's dependencies are loaded
+    module = importlib.import_module(f".{module_name}", __package__)
+
+    return module.Writer(writer.config)
@@ -0,0 +1,134 @@
+from cherry_etl import config as cc
+from cherry_etl import pipeline as cp
+from cherry_etl.writers.base import DataWriter
+from typing import Any, Dict, List, Optional
+import pyarrow as pa
+import asyncio
+import pytest
+import time
+
+
+class FakeStream:
+    def __init__(
+        self, num_batches: int, fail_at: Optional[int] = None, delay: float = 0
+    ):
+        self.num_batches = num_batches
+        self.fail_at = fail_at
+        self.delay = delay
+        self.next_batch = 0
+
+    async def next(self) -> Optional[Dict[str, pa.RecordBatch]]:
+        # only batches after the first wait, like a stream tailing the chain head
+        await asyncio.sleep(self.delay if self.next_batch > 0 else 0)
+
+        if self.next_batch == self.fail_at:
+            raise RuntimeError("ingest failed")
+
+        if self.next_batch == self.num_batches:
+            return None
+
+        batch = pa.RecordBatch.from_pydict({"batch": [self.next_batch]})
+        self.next_batch += 1
+
+        return {"data": batch}
+
+
+class RecordingWriter(DataWriter):
+    def __init__(self, fail_at: Optional[int] = None):
+        self.fail_at = fail_at
+        self.batches: List[int] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def push_data(self, data: Dict[str, pa.Table]) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+
+        try:
+            await asyncio.sleep(0.01)
+
+            batch = data["data"].column("batch")[0].as_py()
+            if batch == self.fail_at:
+                raise ValueError(f"write of batch {batch} failed")
+
+            self.batches.append(batch)
+        finally:
+            self.active -= 1
+
+
+def make_pipeline(
+    monkeypatch, stream: FakeStream, writer: RecordingWriter
+) -> cc.Pipeline:
+    monkeypatch.setattr(cp, "start_stream", lambda provider, query: stream)
+    monkeypatch.setattr(cp, "create_writer", lambda config: writer)
+
+    # provider, query and writer config are only passed to the patched functions
+    unused: Any = None
+    return cc.Pipeline(provider=unused, query=unused, writer=unused, steps=[])
+
+
+def run(monkeypatch, stream: FakeStream, writer: RecordingWriter):
+    asyncio.run(cp.run_pipeline(make_pipeline(monkeypatch, stream, writer)))
+
+
+def test_run_pipeline_writes_in_order(monkeypatch):
+    writer = RecordingWriter()
+
+    run(monkeypatch, FakeStream(5), writer)
+
+    assert writer.batches == [0, 1, 2, 3, 4]
+    assert writer.max_active == 1
+
+
+def test_run_pipeline_raises_write_error(monkeypatch):
+    writer = RecordingWriter(fail_at=1)
+
+    with pytest.raises(ValueError, match="write of batch 1 failed"):
+        run(monkeypatch, FakeStream(5), writer)
+
+    assert writer.batches == [0]
+
+
+def test_run_pipeline_raises_ingest_error_over_write_error(monkeypatch):
+    writer = RecordingWriter(fail_at=1)
+
+    with pytest.raises(RuntimeError, match="ingest failed"):
+        run(monkeypatch, FakeStream(5, fail_at=2), writer)
+
+    assert writer.batches == [0]
+
+
+def test_run_pipeline_raises_write_error_while_waiting_for_ingest(monkeypatch):
+    writer = RecordingWriter(fail_at=0)
+
+    start = time.monotonic()
+
+    with pytest.raises(ValueError, match="write of batch 0 failed"):
+        run(monkeypatch, FakeStream(5, delay=3), writer)
+
+    assert time.monotonic() - start < 1
+
+
+# without a delay the cancel lands while the pipeline waits on the write itself
+@pytest.mark.parametrize("delay", [0, 3])
+def test_run_pipeline_cancel_lets_write_finish(monkeypatch, delay: float):
+    writer = RecordingWriter()
+    pipeline = make_pipeline(monkeypatch, FakeStream(5, delay=delay), writer)
+
+    async def cancel_during_write():
+        task = asyncio.create_task(cp.run_pipeline(pipeline))
+
+        while writer.active == 0:
+            await asyncio.sleep(0)
+
+        # give the next batch time to be fetched and processed
+        await asyncio.sleep(0.005)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_during_write())
+
+    assert writer.batches == [0]
+    assert writer.active == 0
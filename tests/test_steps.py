@@ -1,8 +1,10 @@
 from cherry_etl import steps as cs
 from cherry_etl import config as cc
 from cherry_etl import utils
+from cherry_etl.pipeline import process_steps
 import pyarrow as pa
 import base58
+from cherry_core import evm_signature_to_topic0
 import binascii
 import datafusion
 import polars as pl
@@ -77,8 +79,72 @@ def test_cast_by_type():
     assert data.column("names").combine_chunks() == names
 
 
+def test_process_steps():
+    numbers = pa.array([1, 2], type=pa.uint8())
+    names = pa.array(["asd", "qwe"], type=pa.binary())
+
+    table = pa.Table.from_arrays([numbers, names], names=["numbers", "names"])
+
+    data = {"data": table}
+
+    out = process_steps(
+        data,
+        [
+            cc.Step(
+                kind=cc.StepKind.CAST,
+                config=cc.CastConfig(
+                    table_name="data", mappings={"numbers": pa.int64()}
+                ),
+            ),
+            cc.Step(kind=cc.StepKind.HEX_ENCODE, config=cc.HexEncodeConfig()),
+        ],
+    )
+
+    # input is left untouched
+    assert data["data"] is table
+
+    out = out["data"]
+
+    assert out.column("numbers").combine_chunks() == pa.array([1, 2], type=pa.int64())
+    assert out.column("names").type == pa.string()
+
+
 def test_evm_decode_events():
-    return
+    topic0 = evm_signature_to_topic0("Transfer(address,address,uint256)")
+    from_addr = b"\x11" * 20
+    to_addr = b"\x22" * 20
+
+    table = pa.Table.from_arrays(
+        [
+            pa.array([1], type=pa.uint64()),
+            pa.array([bytes.fromhex(topic0[2:])], type=pa.binary()),
+            pa.array([b"\x00" * 12 + from_addr], type=pa.binary()),
+            pa.array([b"\x00" * 12 + to_addr], type=pa.binary()),
+            pa.array([None], type=pa.binary()),
+            pa.array([(1234).to_bytes(32, "big")], type=pa.binary()),
+        ],
+        names=["block_number", "topic0", "topic1", "topic2", "topic3", "data"],
+    )
+
+    data = {"logs": table}
+
+    data = cs.evm_decode_events.execute(
+        data,
+        cc.EvmDecodeEventsConfig(
+            event_signature="Transfer(address indexed from, address indexed to, uint256 amount)",
+        ),
+    )
+
+    decoded = data["decoded_logs"]
+
+    assert decoded.column_names == ["from", "to", "amount"] + table.column_names
+    assert decoded.column("from").to_pylist() == [from_addr]
+    assert decoded.column("to").to_pylist() == [to_addr]
+    assert decoded.column("amount").to_pylist() == [1234]
+    assert (
+        decoded.column("block_number").combine_chunks()
+        == table.column("block_number").combine_chunks()
+    )
 
 
 def test_evm_validate_block_data():
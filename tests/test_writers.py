@@ -0,0 +1,130 @@
+from cherry_etl import config as cc
+from cherry_etl.writers.writer import create_writer
+from pyiceberg.catalog.sql import SqlCatalog
+import pyarrow as pa
+import asyncio
+import duckdb
+
+
+def test_iceberg_writer_in_memory_catalog(tmp_path):
+    catalog = SqlCatalog(
+        "test",
+        uri="sqlite:///:memory:",
+        warehouse=f"file://{tmp_path}",
+    )
+
+    writer = create_writer(
+        cc.Writer(
+            kind=cc.WriterKind.ICEBERG,
+            config=cc.IcebergWriterConfig(
+                namespace="test",
+                catalog=catalog,
+                write_location=f"file://{tmp_path}/data",
+            ),
+        )
+    )
+
+    table = pa.Table.from_arrays([pa.array([1, 2], type=pa.int64())], names=["numbers"])
+
+    asyncio.run(writer.push_data({"data": table}))
+    asyncio.run(writer.push_data({"data": table}))
+
+    out = catalog.load_table("test.data").scan().to_arrow()
+
+    assert out.column("numbers").to_pylist() == [1, 2, 1, 2]
+
+
+def test_iceberg_writer_table_changed_between_pushes(tmp_path):
+    def sql_catalog():
+        return SqlCatalog(
+            "test",
+            uri=f"sqlite:///{tmp_path}/catalog.db",
+            warehouse=f"file://{tmp_path}",
+        )
+
+    catalog = sql_catalog()
+
+    writer = create_writer(
+        cc.Writer(
+            kind=cc.WriterKind.ICEBERG,
+            config=cc.IcebergWriterConfig(
+                namespace="test",
+                catalog=catalog,
+                write_location=f"file://{tmp_path}/data",
+            ),
+        )
+    )
+
+    table = pa.Table.from_arrays([pa.array([1, 2], type=pa.int64())], names=["numbers"])
+
+    asyncio.run(writer.push_data({"data": table}))
+
+    # commit through a second catalog handle so the writer's cached table is stale
+    sql_catalog().load_table("test.data").append(table)
+
+    asyncio.run(writer.push_data({"data": table}))
+
+    out = catalog.load_table("test.data").scan().to_arrow()
+
+    assert out.column("numbers").to_pylist() == [1, 2, 1, 2, 1, 2]
+
+
+def duckdb_writer(connection):
+    return create_writer(
+        cc.Writer(
+            kind=cc.WriterKind.DUCKDB,
+            config=cc.DuckdbWriterConfig(connection=connection),
+        )
+    )
+
+
+def test_duckdb_writer_appends_to_existing_table():
+    connection = duckdb.connect()
+    connection.sql("CREATE TABLE data (numbers BIGINT)")
+    connection.sql("INSERT INTO data VALUES (0)")
+
+    writer = duckdb_writer(connection)
+
+    table = pa.Table.from_arrays([pa.array([1, 2], type=pa.int64())], names=["numbers"])
+
+    asyncio.run(writer.push_data({"data": table}))
+    asyncio.run(writer.push_data({"data": table}))
+
+    out = connection.sql("SELECT numbers FROM data").fetchall()
+
+    assert out == [(0,), (1,), (2,), (1,), (2,)]
+
+
+def test_duckdb_writer_creates_missing_table():
+    connection = duckdb.connect()
+
+    writer = duckdb_writer(connection)
+
+    table = pa.Table.from_arrays([pa.array([1, 2], type=pa.int64())], names=["numbers"])
+
+    asyncio.run(writer.push_data({"data": table}))
+
+    out = connection.sql("SELECT numbers FROM data").fetchall()
+
+    assert out == [(1,), (2,)]
+
+
+def test_duckdb_writer_creates_empty_table():
+    connection = duckdb.connect()
+
+    writer = duckdb_writer(connection)
+
+    empty = pa.Table.from_arrays([pa.array([], type=pa.int64())], names=["numbers"])
+
+    asyncio.run(writer.push_data({"data": empty}))
+
+    out = connection.sql("SELECT numbers FROM data").fetchall()
+    assert out == []
+
+    table = pa.Table.from_arrays([pa.array([1, 2], type=pa.int64())], names=["numbers"])
+
+    asyncio.run(writer.push_data({"data": empty}))
+    asyncio.run(writer.push_data({"data": table}))
+
+    out = connection.sql("SELECT numbers FROM data").fetchall()
+    assert out == [(1,), (2,)]